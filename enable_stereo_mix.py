@@ -5,7 +5,6 @@ if it exists on your system. Stereo Mix captures your system audio output.
 """
 
 import subprocess
-import sys
 
 
 def enable_stereo_mix() -> bool:
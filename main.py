@@ -3,7 +3,8 @@
 import asyncio
 import logging
 import sys
-from typing import Optional
+from logging.handlers import RotatingFileHandler
+from typing import Callable, Dict, Optional
 from src.config import ConfigLoader, AudioSourceConfig, BotConfig
 from src.bot import DJBot
 from src.audio_device import AudioDeviceEnumerator, AudioDevice
@@ -11,13 +12,17 @@ from src.audio_source_factory import AudioSourceFactory
 
 
 def setup_logging() -> None:
-    """Configure logging for the application."""
+    """Configure logging for the application.
+
+    The file log rotates at 5 MB (3 backups kept) so a long-running bot
+    never grows an unbounded bot.log.
+    """
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler('bot.log')
+            RotatingFileHandler('bot.log', maxBytes=5 * 1024 * 1024, backupCount=3)
         ]
     )
 
@@ -42,59 +47,62 @@ def select_audio_source(config: BotConfig) -> AudioSourceConfig:
         print(f"\nWarning: Could not enumerate local audio devices: {e}")
         devices = []
 
-    # Build menu options
-    menu_options = []
+    # Build menu as a dispatch table: option number -> config factory
+    dispatch: Dict[int, Callable[[], Optional[AudioSourceConfig]]] = {}
     option_num = 1
 
+    def _local_option(device: AudioDevice) -> Callable[[], Optional[AudioSourceConfig]]:
+        return lambda: AudioSourceConfig(
+            source_type="local",
+            device_index=device.index,
+            bitrate=config.audio.bitrate,
+            sample_rate=config.audio.sample_rate,
+        )
+
+    def _url_option() -> Optional[AudioSourceConfig]:
+        url = input("Enter stream URL: ").strip()
+        if not url:
+            print("URL cannot be empty!")
+            return None
+        return AudioSourceConfig(
+            source_type="url",
+            url=url,
+            bitrate=config.audio.bitrate,
+        )
+
     # Add local devices
     if devices:
         print("\nLocal Audio Devices:")
         for device in devices:
             print(f"  {option_num}. {device.name}")
-            menu_options.append(("local", device))
+            dispatch[option_num] = _local_option(device)
             option_num += 1
 
     # Add custom URL option
     print(f"  {option_num}. Custom URL Stream")
-    menu_options.append(("url", None))
+    dispatch[option_num] = _url_option
 
-    if not menu_options:
+    if not dispatch:
         print("\nNo audio sources available!")
         print("Please check your configuration or install FFmpeg.")
         sys.exit(1)
 
     # Get user selection
     print("\n" + "=" * 60)
+    max_choice = len(dispatch)
     while True:
         try:
             selection = input("Select audio source (enter number): ").strip()
             choice_num = int(selection)
 
-            if 1 <= choice_num <= len(menu_options):
-                source_type, source_data = menu_options[choice_num - 1]
-
-                if source_type == "local":
-                    device = source_data
-                    return AudioSourceConfig(
-                        source_type="local",
-                        device_index=device.index,
-                        bitrate=config.audio.bitrate,
-                        sample_rate=config.audio.sample_rate,
-                    )
-
-                elif source_type == "url":
-                    url = input("Enter stream URL: ").strip()
-                    if not url:
-                        print("URL cannot be empty!")
-                        continue
-                    return AudioSourceConfig(
-                        source_type="url",
-                        url=url,
-                        bitrate=config.audio.bitrate,
-                    )
+            if 1 <= choice_num <= max_choice:
+                source_config = dispatch[choice_num]()
+                if source_config is not None:
+                    return source_config
+                # Factory declined (e.g. empty URL); re-prompt
 
             else:
-                print(f"Please enter a number between 1 and {len(menu_options)}")
+                print(f"Please enter a number between 1 and {max_choice}")
 
         except ValueError:
             print("Invalid input! Please enter a number.")
@@ -118,15 +126,7 @@ async def main() -> None:
         config.audio_source = audio_source_config
 
         # Create the audio source
-        source = AudioSourceFactory.create_from_config(
-            source_type=audio_source_config.source_type,
-            config={
-                "device_index": audio_source_config.device_index,
-                "url": audio_source_config.url,
-                "bitrate": audio_source_config.bitrate,
-                "sample_rate": audio_source_config.sample_rate,
-            }
-        )
+        source = AudioSourceFactory.create_from_config(audio_source_config)
 
         print(f"\n✓ Selected: {source.get_description()}")
         print("=" * 60)
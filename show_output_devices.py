@@ -1,44 +1,51 @@
 """Show available output devices for routing apps."""
 
-from src.audio_device import AudioDeviceEnumerator
+import sys
 
-print("=" * 70)
-print("Available Audio Output Devices for App Routing")
-print("=" * 70)
-print()
-print("Pick one of these devices to route your apps to:")
-print("(The bot will capture from its loopback)")
-print()
+from src.audio_device import AudioDeviceEnumerator
 
-devices = AudioDeviceEnumerator.enumerate_devices()
+lines = [
+    "=" * 70,
+    "Available Audio Output Devices for App Routing",
+    "=" * 70,
+    "",
+    "Pick one of these devices to route your apps to:",
+    "(The bot will capture from its loopback)",
+    "",
+]
 
-# Show only output devices
-output_devices = [d for d in devices if d.device_type == "output"]
+# Show only output devices (prepartitioned at enumeration time)
+output_devices = AudioDeviceEnumerator.enumerate_outputs()
 
 for device in output_devices:
-    print(f"{device.index}. {device.name}")
+    lines.append(f"{device.index}. {device.name}")
+
+lines += [
+    "",
+    "=" * 70,
+    "How to route apps to a specific output:",
+    "=" * 70,
+    "",
+    "Option 1 - Windows Settings (Per-App):",
+    "  1. Right-click speaker icon → 'Open Sound settings'",
+    "  2. Scroll down → 'Advanced sound options'",
+    "  3. Click 'App volume and device preferences'",
+    "  4. For each app (Spotify, Chrome, etc.):",
+    "     - Set Output device to one of the devices above",
+    "",
+    "Option 2 - Windows Sound Control Panel:",
+    "  1. Right-click speaker icon → 'Sounds'",
+    "  2. Playback tab → Select a device → 'Set Default'",
+    "  3. All apps will use that device",
+    "",
+    "Recommendation:",
+    "  - Use one of the NVIDIA monitor outputs if you don't listen through them",
+    "  - Or use 'Line (2- DDJ-FLX2)' if you're not using that",
+    "  - Set Discord to output to your real speakers (Realtek)",
+    "  - Bot captures from the device you route apps to",
+    "",
+    "=" * 70,
+]
 
-print()
-print("=" * 70)
-print("How to route apps to a specific output:")
-print("=" * 70)
-print()
-print("Option 1 - Windows Settings (Per-App):")
-print("  1. Right-click speaker icon → 'Open Sound settings'")
-print("  2. Scroll down → 'Advanced sound options'")
-print("  3. Click 'App volume and device preferences'")
-print("  4. For each app (Spotify, Chrome, etc.):")
-print("     - Set Output device to one of the devices above")
-print()
-print("Option 2 - Windows Sound Control Panel:")
-print("  1. Right-click speaker icon → 'Sounds'")
-print("  2. Playback tab → Select a device → 'Set Default'")
-print("  3. All apps will use that device")
-print()
-print("Recommendation:")
-print("  - Use one of the NVIDIA monitor outputs if you don't listen through them")
-print("  - Or use 'Line (2- DDJ-FLX2)' if you're not using that")
-print("  - Set Discord to output to your real speakers (Realtek)")
-print("  - Bot captures from the device you route apps to")
-print()
-print("=" * 70)
+# One write instead of a syscall per print()
+sys.stdout.write("\n".join(lines) + "\n")
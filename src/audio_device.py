@@ -1,19 +1,96 @@
 """Audio device enumeration and management."""
 
+import asyncio
 import logging
 import platform
 import subprocess
 import re
-from typing import List, Optional
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
+from dataclasses import dataclass, replace
 
 
 logger = logging.getLogger(__name__)
 
+# FFmpeg device probes normally finish well under a second; a short timeout
+# reaps hung instances quickly instead of stalling startup for 10s.
+_FFMPEG_PROBE_TIMEOUT = 3
 
-@dataclass
+# Precompiled patterns for FFmpeg device-listing output
+_DSHOW_AUDIO_RE = re.compile(r'"([^"]+)"\s*\(audio\)')
+_AVF_DEV_RE = re.compile(r"\[.*?\]\s+\[\d+\]\s+(.+)")
+
+# Device-name keywords that indicate a system audio (loopback-style) capture
+_STEREO_KEYWORDS = ("stereo mix", "wave out", "what u hear")
+
+
+@lru_cache(maxsize=1)
+def _get_pyaudio() -> Any:
+    """Import and cache the pyaudiowpatch module.
+
+    The module loads Windows-specific C extensions, so it is only imported
+    the first time WASAPI enumeration actually runs.
+
+    Returns:
+        The pyaudiowpatch module.
+
+    Raises:
+        ImportError: If pyaudiowpatch is not installed.
+    """
+    import pyaudiowpatch
+
+    return pyaudiowpatch
+
+
+@contextmanager
+def _pyaudio_instance() -> Iterator[Any]:
+    """Yield a PyAudio instance that is always terminated on exit.
+
+    PyAudio holds COM objects and PortAudio worker threads; leaking them on
+    an exception mid-enumeration accumulates handles across rescans.
+
+    Yields:
+        Initialized PyAudio instance.
+
+    Raises:
+        ImportError: If pyaudiowpatch is not installed.
+    """
+    p = _get_pyaudio().PyAudio()
+    try:
+        yield p
+    finally:
+        p.terminate()
+
+
+def _is_stereo_mix(device_name: str) -> bool:
+    """Check whether a device name looks like a system audio capture device.
+
+    Args:
+        device_name: Device name as reported by the enumerator.
+
+    Returns:
+        True if the name matches a known Stereo Mix-style keyword.
+    """
+    # Lowercase once and unroll the keyword checks; this runs per device in
+    # the enumeration hot path.
+    dn_lower = device_name.lower()
+    return (
+        "stereo mix" in dn_lower or "wave out" in dn_lower or "what u hear" in dn_lower
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class AudioDevice:
-    """Represents an audio device."""
+    """Represents an audio device.
+
+    Frozen and slotted: instances are cached and shared across callers, so
+    they must be immutable (and hashable), and slots keep the per-device
+    footprint small.
+    """
 
     index: int
     name: str
@@ -22,12 +99,38 @@ class AudioDevice:
 
 
 class AudioDeviceEnumerator:
-    """Enumerates available audio devices on the system."""
+    """Enumerates available audio devices on the system.
+
+    Enumeration shells out to FFmpeg and initializes PyAudio, which can take
+    several seconds, so results are cached for a short TTL. Call
+    ``invalidate()`` after a known device change (e.g. hotplug) to force
+    re-enumeration.
+    """
+
+    # Cached enumeration results shared across callers, partitioned by
+    # device type at cache time so filtered lookups are zero-cost.
+    _cache: Optional[List[AudioDevice]] = None
+    _cache_outputs: Optional[List[AudioDevice]] = None
+    _cache_by_index: Optional[Dict[int, AudioDevice]] = None
+    _cache_time: float = 0.0
+    _CACHE_TTL_SECONDS: float = 60.0
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Invalidate the cached device list, forcing re-enumeration."""
+        cls._cache = None
+        cls._cache_outputs = None
+        cls._cache_by_index = None
+        cls._cache_time = 0.0
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_system_type() -> str:
         """Get the operating system type.
 
+        The result is memoized — ``platform.system()`` goes through a
+        uname/registry lookup, and the OS does not change at runtime.
+
         Returns:
             'windows', 'linux', or 'darwin' (macOS).
         """
@@ -37,63 +140,103 @@ class AudioDeviceEnumerator:
     def enumerate_devices() -> List[AudioDevice]:
         """Enumerate all available audio input devices.
 
+        Results are cached for a short TTL since enumeration involves slow
+        FFmpeg/PyAudio calls. Use ``invalidate()`` to force a fresh scan.
+
         Returns:
             List of available audio devices.
 
         Raises:
             RuntimeError: If FFmpeg is not available or device enumeration fails.
         """
-        system = AudioDeviceEnumerator.get_system_type()
+        cls = AudioDeviceEnumerator
+        if (
+            cls._cache is not None
+            and time.monotonic() - cls._cache_time < cls._CACHE_TTL_SECONDS
+        ):
+            return cls._cache
+
+        system = cls.get_system_type()
 
         if system == "windows":
-            return AudioDeviceEnumerator._enumerate_windows_devices()
+            devices = cls._enumerate_windows_devices()
         elif system == "linux":
-            return AudioDeviceEnumerator._enumerate_linux_devices()
+            devices = cls._enumerate_linux_devices()
         elif system == "darwin":
-            return AudioDeviceEnumerator._enumerate_macos_devices()
+            devices = cls._enumerate_macos_devices()
         else:
             raise RuntimeError(f"Unsupported operating system: {system}")
 
+        cls._cache = devices
+        cls._cache_outputs = [d for d in devices if d.device_type == "output"]
+        cls._cache_by_index = {d.index: d for d in devices}
+        cls._cache_time = time.monotonic()
+        return devices
+
     @staticmethod
-    def _enumerate_windows_devices() -> List[AudioDevice]:
-        """Enumerate audio devices on Windows using DirectShow and WASAPI loopback.
+    def enumerate_outputs() -> List[AudioDevice]:
+        """Enumerate output (system audio) devices only.
+
+        The output partition is computed once at enumeration time, so this
+        is a zero-cost lookup while the cache is warm.
+
+        Returns:
+            List of output-type audio devices.
+
+        Raises:
+            RuntimeError: If FFmpeg is not available or device enumeration fails.
+        """
+        AudioDeviceEnumerator.enumerate_devices()
+        return AudioDeviceEnumerator._cache_outputs or []
+
+    @staticmethod
+    async def enumerate_devices_async() -> List[AudioDevice]:
+        """Enumerate audio devices without blocking the event loop.
+
+        The synchronous scan blocks on subprocess and PyAudio calls for up
+        to several seconds, which would freeze discord.py's event loop if
+        called from a command handler. This variant runs it in a worker
+        thread; async callers must use this instead of
+        ``enumerate_devices()``.
 
         Returns:
             List of available audio devices.
 
         Raises:
-            RuntimeError: If FFmpeg is not available.
+            RuntimeError: If FFmpeg is not available or device enumeration fails.
         """
-        devices = []
-        device_index = 1
+        return await asyncio.to_thread(AudioDeviceEnumerator.enumerate_devices)
 
-        # First, enumerate WASAPI loopback devices (system audio capture)
-        try:
-            import pyaudiowpatch as pyaudio
+    @staticmethod
+    def _scan_wasapi() -> List[AudioDevice]:
+        """Scan WASAPI loopback devices (system audio capture).
 
-            p = pyaudio.PyAudio()
+        Returns:
+            List of loopback devices with placeholder index 0.
+        """
+        devices: List[AudioDevice] = []
 
-            # Get all loopback devices
-            for i in range(p.get_device_count()):
-                info = p.get_device_info_by_index(i)
+        try:
+            with _pyaudio_instance() as p:
+                # Get all loopback devices
+                for i in range(p.get_device_count()):
+                    info = p.get_device_info_by_index(i)
 
-                # Only include loopback devices (system audio output capture)
-                if info.get("isLoopbackDevice", False):
-                    device_name = info["name"]
-                    # Clean up the name - remove " [Loopback]" suffix if present
-                    display_name = device_name.replace(" [Loopback]", "")
+                    # Only include loopback devices (system audio output capture)
+                    if info.get("isLoopbackDevice", False):
+                        device_name = info["name"]
+                        # Clean up the name - remove " [Loopback]" suffix if present
+                        display_name = device_name.replace(" [Loopback]", "")
 
-                    devices.append(
-                        AudioDevice(
-                            index=device_index,
-                            name=f"{display_name} [System Audio Output]",
-                            device_id=f"wasapi:{i}",  # Store PyAudio device index
-                            device_type="output",
+                        devices.append(
+                            AudioDevice(
+                                index=0,
+                                name=f"{display_name} [System Audio Output]",
+                                device_id=f"wasapi:{i}",  # Store PyAudio device index
+                                device_type="output",
+                            )
                         )
-                    )
-                    device_index += 1
 
-            p.terminate()
             logger.info(f"Found {len(devices)} WASAPI loopback devices")
 
         except ImportError:
@@ -103,30 +246,130 @@ class AudioDeviceEnumerator:
         except Exception as e:
             logger.error(f"Error enumerating WASAPI loopback devices: {e}")
 
-        # Also enumerate DirectShow devices (microphones, Stereo Mix if enabled)
+        return devices
+
+    @staticmethod
+    def _scan_dshow() -> List[AudioDevice]:
+        """Scan DirectShow devices (microphones, Stereo Mix if enabled).
+
+        Prefers the native MMDevice API (via pycaw) which enumerates in
+        milliseconds; falls back to spawning FFmpeg and parsing its stderr
+        when pycaw is unavailable.
+
+        Returns:
+            List of DirectShow devices with placeholder index 0.
+
+        Raises:
+            RuntimeError: If FFmpeg is not available for the fallback path.
+        """
+        try:
+            return AudioDeviceEnumerator._scan_dshow_native()
+        except ImportError:
+            logger.debug("pycaw not available, falling back to FFmpeg enumeration")
+        except Exception as e:
+            logger.error(f"MMDevice enumeration failed, falling back to FFmpeg: {e}")
+
+        return AudioDeviceEnumerator._scan_dshow_ffmpeg()
+
+    @staticmethod
+    def _scan_dshow_native() -> List[AudioDevice]:
+        """Scan capture endpoints via the Windows MMDevice API.
+
+        Returns:
+            List of capture devices with placeholder index 0.
+
+        Raises:
+            ImportError: If pycaw is not installed.
+        """
+        from pycaw.pycaw import AudioUtilities
+        from pycaw.constants import EDataFlow, DEVICE_STATE
+
+        devices: List[AudioDevice] = []
+
+        enumerator = AudioUtilities.GetDeviceEnumerator()
+        collection = enumerator.EnumAudioEndpoints(
+            EDataFlow.eCapture.value, DEVICE_STATE.ACTIVE.value
+        )
+
+        for i in range(collection.GetCount()):
+            device = AudioUtilities.CreateDevice(collection.Item(i))
+            device_name = device.FriendlyName
+            if not device_name:
+                continue
+
+            # Detect if this is Stereo Mix
+            is_stereo_mix = _is_stereo_mix(device_name)
+
+            devices.append(
+                AudioDevice(
+                    index=0,
+                    name=f"{device_name}"
+                    + (" [System Audio]" if is_stereo_mix else " [Microphone]"),
+                    # Keep FFmpeg command-line compatibility downstream
+                    device_id=f"dshow:audio={device_name}",
+                    device_type="output" if is_stereo_mix else "input",
+                )
+            )
+
+        logger.info(f"Found {len(devices)} capture devices via MMDevice API")
+        return devices
+
+    @staticmethod
+    def _scan_dshow_ffmpeg() -> List[AudioDevice]:
+        """Scan DirectShow devices by parsing FFmpeg's device listing.
+
+        Returns:
+            List of DirectShow devices with placeholder index 0.
+
+        Raises:
+            RuntimeError: If FFmpeg is not available.
+        """
+        devices: List[AudioDevice] = []
+
         try:
-            result = subprocess.run(
-                ["ffmpeg", "-list_devices", "true", "-f", "dshow", "-i", "dummy"],
-                capture_output=True,
+            proc = subprocess.Popen(
+                [
+                    "ffmpeg",
+                    "-hide_banner",
+                    "-loglevel",
+                    "info",
+                    "-list_devices",
+                    "true",
+                    "-f",
+                    "dshow",
+                    "-i",
+                    "dummy",
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=10,
+            )
+        except FileNotFoundError:
+            raise RuntimeError(
+                "FFmpeg not found. Please install FFmpeg and add it to your PATH."
             )
 
-            # Parse DirectShow devices
-            for line in result.stderr.split("\n"):
+        # Kill the probe if FFmpeg hangs without producing output
+        watchdog = threading.Timer(_FFMPEG_PROBE_TIMEOUT, proc.kill)
+        watchdog.start()
+
+        in_audio_section = False
+        try:
+            assert proc.stderr is not None
+            # Parse DirectShow devices as FFmpeg emits them instead of
+            # buffering the whole stderr and waiting for process exit
+            for line in proc.stderr:
                 if "(audio)" in line and '"' in line:
-                    match = re.search(r'"([^"]+)"\s*\(audio\)', line)
+                    in_audio_section = True
+                    match = _DSHOW_AUDIO_RE.search(line)
                     if match:
                         device_name = match.group(1)
                         # Detect if this is Stereo Mix
-                        is_stereo_mix = any(
-                            keyword in device_name.lower()
-                            for keyword in ["stereo mix", "wave out", "what u hear"]
-                        )
+                        is_stereo_mix = _is_stereo_mix(device_name)
 
                         devices.append(
                             AudioDevice(
-                                index=device_index,
+                                index=0,
                                 name=f"{device_name}"
                                 + (
                                     " [System Audio]"
@@ -137,16 +380,45 @@ class AudioDeviceEnumerator:
                                 device_type="output" if is_stereo_mix else "input",
                             )
                         )
-                        device_index += 1
-
-        except FileNotFoundError:
-            raise RuntimeError(
-                "FFmpeg not found. Please install FFmpeg and add it to your PATH."
-            )
-        except subprocess.TimeoutExpired:
-            logger.warning("FFmpeg device enumeration timed out")
+                elif in_audio_section and "Alternative name" not in line:
+                    # Past the audio device section; no need to wait for
+                    # FFmpeg to exit on its own (it can be slow to do so)
+                    break
         except Exception as e:
             logger.error(f"Failed to enumerate DirectShow devices: {e}")
+        finally:
+            watchdog.cancel()
+            proc.terminate()
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+        return devices
+
+    @staticmethod
+    def _enumerate_windows_devices() -> List[AudioDevice]:
+        """Enumerate audio devices on Windows using DirectShow and WASAPI loopback.
+
+        The WASAPI and DirectShow scans are independent I/O-bound operations,
+        so they run concurrently to cut startup latency.
+
+        Returns:
+            List of available audio devices.
+
+        Raises:
+            RuntimeError: If FFmpeg is not available.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            wasapi_future = executor.submit(AudioDeviceEnumerator._scan_wasapi)
+            dshow_future = executor.submit(AudioDeviceEnumerator._scan_dshow)
+            merged = wasapi_future.result() + dshow_future.result()
+
+        # Assign final 1-based indices in a single pass
+        devices = [
+            replace(device, index=device_index)
+            for device_index, device in enumerate(merged, start=1)
+        ]
 
         if not devices:
             logger.warning("No audio devices found on Windows")
@@ -166,10 +438,10 @@ class AudioDeviceEnumerator:
         try:
             # Try PulseAudio first
             result = subprocess.run(
-                ["ffmpeg", "-sources", "pulse"],
+                ["ffmpeg", "-hide_banner", "-sources", "pulse"],
                 capture_output=True,
                 text=True,
-                timeout=10,
+                timeout=_FFMPEG_PROBE_TIMEOUT,
             )
 
             devices = []
@@ -195,17 +467,20 @@ class AudioDeviceEnumerator:
                     ["arecord", "-L"],
                     capture_output=True,
                     text=True,
-                    timeout=10,
+                    timeout=_FFMPEG_PROBE_TIMEOUT,
                 )
 
-                for line in result.stdout.split("\n"):
-                    line = line.strip()
-                    if line and not line.startswith(" "):
+                # Device names start at column 0; indented lines are
+                # descriptions. Check the first character directly instead of
+                # allocating a stripped copy of every line.
+                for line in result.stdout.splitlines():
+                    if line and line[0] != " " and line[0] != "\t":
+                        name = line.rstrip()
                         devices.append(
                             AudioDevice(
                                 index=device_index,
-                                name=line,
-                                device_id=line,
+                                name=name,
+                                device_id=name,
                                 device_type="input",
                             )
                         )
@@ -233,10 +508,21 @@ class AudioDeviceEnumerator:
         try:
             # Run FFmpeg to list AVFoundation devices
             result = subprocess.run(
-                ["ffmpeg", "-f", "avfoundation", "-list_devices", "true", "-i", ""],
+                [
+                    "ffmpeg",
+                    "-hide_banner",
+                    "-loglevel",
+                    "info",
+                    "-f",
+                    "avfoundation",
+                    "-list_devices",
+                    "true",
+                    "-i",
+                    "",
+                ],
                 capture_output=True,
                 text=True,
-                timeout=10,
+                timeout=_FFMPEG_PROBE_TIMEOUT,
             )
 
             devices = []
@@ -254,7 +540,7 @@ class AudioDeviceEnumerator:
 
                 if in_audio_section and "]" in line:
                     # Extract device name
-                    match = re.search(r"\[.*?\]\s+\[\d+\]\s+(.+)", line)
+                    match = _AVF_DEV_RE.search(line)
                     if match:
                         device_name = match.group(1).strip()
                         devices.append(
@@ -280,17 +566,19 @@ class AudioDeviceEnumerator:
     def get_device_by_index(index: int) -> Optional[AudioDevice]:
         """Get audio device by index.
 
+        Resolving multiple configured sources by index is a single bulk
+        enumeration followed by O(1) dict lookups: the index map is built
+        once at cache-fill time and reused until ``invalidate()``.
+
         Args:
             index: Device index (1-based).
 
         Returns:
             AudioDevice if found, None otherwise.
         """
-        devices = AudioDeviceEnumerator.enumerate_devices()
-        for device in devices:
-            if device.index == index:
-                return device
-        return None
+        AudioDeviceEnumerator.enumerate_devices()
+        assert AudioDeviceEnumerator._cache_by_index is not None
+        return AudioDeviceEnumerator._cache_by_index.get(index)
 
     @staticmethod
     def display_devices() -> None:
@@ -1,19 +1,21 @@
 """Factory for creating audio sources based on configuration."""
 
 import logging
-from typing import Optional, Union
+from typing import Callable, Dict, Union
 from src.audio_sources import (
-    AudioSourceProtocol,
     LocalAudioSource,
     URLAudioSource,
     WASAPILoopbackAudioSource,
-    AudioSourceType,
 )
 from src.audio_device import AudioDevice, AudioDeviceEnumerator
+from src.config import AudioSourceConfig
 
 
 logger = logging.getLogger(__name__)
 
+# device_id prefix marking WASAPI loopback devices (see AudioDeviceEnumerator)
+_WASAPI_PREFIX = "wasapi:"
+
 
 class AudioSourceFactory:
     """Factory for creating different types of audio sources."""
@@ -34,7 +36,7 @@ class AudioSourceFactory:
         Returns:
             LocalAudioSource instance.
         """
-        logger.info(f"Creating local audio source for device: {device.name}")
+        logger.info("Creating local audio source for device: %s", device.name)
         return LocalAudioSource(device=device, sample_rate=sample_rate, bitrate=bitrate)
 
     @staticmethod
@@ -61,9 +63,9 @@ class AudioSourceFactory:
             raise ValueError(f"No audio device found with index {device_index}")
 
         # Check if this is a WASAPI loopback device
-        if device.device_id.startswith("wasapi:"):
-            # Extract PyAudio device index from device_id
-            pyaudio_index = int(device.device_id.split(":")[1])
+        if device.device_id.startswith(_WASAPI_PREFIX):
+            # Extract PyAudio device index by slicing off the known prefix
+            pyaudio_index = int(device.device_id[len(_WASAPI_PREFIX) :])
             return WASAPILoopbackAudioSource(
                 device_index=pyaudio_index,
                 sample_rate=sample_rate,
@@ -90,19 +92,17 @@ class AudioSourceFactory:
         Returns:
             URLAudioSource instance.
         """
-        logger.info(f"Creating URL audio source for: {url}")
+        logger.info("Creating URL audio source for: %s", url)
         return URLAudioSource(url=url, bitrate=bitrate)
 
     @staticmethod
     def create_from_config(
-        source_type: str,
-        config: dict,
+        config: AudioSourceConfig,
     ) -> Union[LocalAudioSource, URLAudioSource, WASAPILoopbackAudioSource]:
         """Create an audio source from configuration.
 
         Args:
-            source_type: Type of source ('local', 'url').
-            config: Configuration dictionary.
+            config: Selected audio source configuration.
 
         Returns:
             Audio source instance.
@@ -110,31 +110,71 @@ class AudioSourceFactory:
         Raises:
             ValueError: If source type is invalid or configuration is missing required fields.
         """
-        source_type_lower = source_type.lower()
+        try:
+            creator = _CREATORS[config.source_type.lower()]
+        except KeyError:
+            raise ValueError(
+                f"Unknown audio source type: {config.source_type}. "
+                f"Expected 'local' or 'url'"
+            )
 
-        if source_type_lower == "local":
-            device_index = config.get("device_index")
-            if device_index is None:
-                raise ValueError("Local audio source requires 'device_index' in config")
+        return creator(config)
 
-            return AudioSourceFactory.create_local_source_by_index(
-                device_index=device_index,
-                sample_rate=config.get("sample_rate", 48000),
-                bitrate=config.get("bitrate", 128),
-            )
 
-        elif source_type_lower == "url":
-            url = config.get("url")
-            if url is None:
-                raise ValueError("URL audio source requires 'url' in config")
+def _create_local_from_config(
+    config: AudioSourceConfig,
+) -> Union[LocalAudioSource, WASAPILoopbackAudioSource]:
+    """Create a local device source from configuration.
 
-            return AudioSourceFactory.create_url_source(
-                url=url,
-                bitrate=config.get("bitrate", 128),
-            )
+    Args:
+        config: Selected audio source configuration.
 
-        else:
-            raise ValueError(
-                f"Unknown audio source type: {source_type}. "
-                f"Expected 'local' or 'url'"
-            )
+    Returns:
+        Audio source instance.
+
+    Raises:
+        ValueError: If device_index is missing or invalid.
+    """
+    if config.device_index is None:
+        raise ValueError("Local audio source requires 'device_index' in config")
+
+    return AudioSourceFactory.create_local_source_by_index(
+        device_index=config.device_index,
+        sample_rate=config.sample_rate,
+        bitrate=config.bitrate,
+    )
+
+
+def _create_url_from_config(config: AudioSourceConfig) -> URLAudioSource:
+    """Create a URL stream source from configuration.
+
+    Args:
+        config: Selected audio source configuration.
+
+    Returns:
+        URLAudioSource instance.
+
+    Raises:
+        ValueError: If url is missing.
+    """
+    if config.url is None:
+        raise ValueError("URL audio source requires 'url' in config")
+
+    return AudioSourceFactory.create_url_source(
+        url=config.url,
+        bitrate=config.bitrate,
+    )
+
+
+# O(1) dispatch by lowered source type; create_from_config maps KeyError to
+# the ValueError callers expect.
+_CREATORS: Dict[
+    str,
+    Callable[
+        [AudioSourceConfig],
+        Union[LocalAudioSource, URLAudioSource, WASAPILoopbackAudioSource],
+    ],
+] = {
+    "local": _create_local_from_config,
+    "url": _create_url_from_config,
+}
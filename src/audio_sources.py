@@ -1,18 +1,128 @@
 """Audio source implementations for different streaming sources."""
 
+import atexit
 import logging
-from typing import Protocol, Optional, Dict, Any
+from collections import deque
+from functools import lru_cache
+from typing import Protocol, Optional, Dict, Any, Deque, Tuple
 from enum import Enum
 import discord
-import subprocess
-import threading
-import io
 from src.audio_device import AudioDevice
 
+try:
+    import audioop
+except ImportError:  # pragma: no cover - stdlib module absent (Python 3.13+)
+    audioop = None  # type: ignore[assignment]
+
+# numpy is optional and absent from requirements.txt; bind it through an
+# Any-typed alias so mypy is clean whether or not it is installed
+try:
+    import numpy
+
+    np: Any = numpy
+except ImportError:  # numpy is optional; audioop paths are used instead
+    np = None
+
 
 logger = logging.getLogger(__name__)
 
 
+# FFmpeg capture input format per platform
+_FFMPEG_INPUT_FORMATS = {
+    "windows": "dshow",
+    "linux": "pulse",  # or 'alsa' as fallback
+    "darwin": "avfoundation",
+}
+
+
+@lru_cache(maxsize=1)
+def _system_type() -> str:
+    """Get the lowered platform name, memoized for the process lifetime.
+
+    Returns:
+        'windows', 'linux', or 'darwin' (macOS).
+    """
+    import platform
+
+    return platform.system().lower()
+
+
+@lru_cache(maxsize=1)
+def _lazy_pyaudio() -> Any:
+    """Import and cache the pyaudiowpatch module on first WASAPI use.
+
+    Returns:
+        The pyaudiowpatch module.
+
+    Raises:
+        ImportError: If pyaudiowpatch is not installed.
+    """
+    import pyaudiowpatch
+
+    return pyaudiowpatch
+
+
+# Process-wide PyAudio instance. Every PyAudio() construction performs a
+# full WASAPI enumeration and repeated construct/terminate cycles have been
+# observed to crash, so the instance is created lazily, shared, and only
+# terminated at interpreter exit.
+_PA_INSTANCE: Optional[Any] = None
+
+
+def _get_pyaudio_instance() -> Any:
+    """Get the shared PyAudio instance, creating it on first use.
+
+    Returns:
+        Initialized PyAudio instance.
+
+    Raises:
+        ImportError: If pyaudiowpatch is not installed.
+    """
+    global _PA_INSTANCE
+    if _PA_INSTANCE is None:
+        _PA_INSTANCE = _lazy_pyaudio().PyAudio()
+        atexit.register(_terminate_pyaudio)
+    return _PA_INSTANCE
+
+
+def _terminate_pyaudio() -> None:
+    """Terminate the shared PyAudio instance at interpreter exit."""
+    global _PA_INSTANCE
+    if _PA_INSTANCE is not None:
+        _PA_INSTANCE.terminate()
+        _PA_INSTANCE = None
+
+
+# Per-index PyAudio device info, cached because each lookup otherwise costs
+# a WASAPI roundtrip (hundreds of ms with many devices).
+_DEVICE_INFO_CACHE: Dict[int, Dict[str, Any]] = {}
+
+
+def _get_device_info(device_index: int) -> Dict[str, Any]:
+    """Get PyAudio device info for an index, caching the lookup.
+
+    Args:
+        device_index: PyAudio device index.
+
+    Returns:
+        Device info mapping as returned by PyAudio.
+
+    Raises:
+        ImportError: If pyaudiowpatch is not installed.
+    """
+    info = _DEVICE_INFO_CACHE.get(device_index)
+    if info is None:
+        p = _get_pyaudio_instance()
+        info = dict(p.get_device_info_by_index(device_index))
+        _DEVICE_INFO_CACHE[device_index] = info
+    return info
+
+
+def invalidate_device_cache() -> None:
+    """Clear cached device info, e.g. after an audio device change."""
+    _DEVICE_INFO_CACHE.clear()
+
+
 class AudioSourceType(Enum):
     """Types of audio sources supported by the bot."""
 
@@ -63,6 +173,17 @@ class AudioSourceProtocol(Protocol):
 class LocalAudioSource:
     """Audio source that captures from a local audio device."""
 
+    __slots__ = (
+        "_device",
+        "_sample_rate",
+        "_bitrate",
+        "_platform",
+        "_input_format",
+        "_input_device",
+        "_before_options",
+        "_options",
+    )
+
     def __init__(
         self, device: AudioDevice, sample_rate: int = 48000, bitrate: int = 128
     ) -> None:
@@ -72,12 +193,23 @@ class LocalAudioSource:
             device: Audio device to capture from.
             sample_rate: Audio sample rate in Hz (default 48000).
             bitrate: Audio bitrate in kbps (default 128).
+
+        Raises:
+            RuntimeError: If the platform is unsupported.
         """
         self._device = device
         self._sample_rate = sample_rate
         self._bitrate = bitrate
         self._platform = device.device_type
 
+        # Resolve platform-dependent FFmpeg arguments once; they cannot
+        # change for the lifetime of the source, so every !play reuses them.
+        self._input_format = self._get_input_format()
+        self._input_device = self._get_input_device()
+        self._before_options = f"-f {self._input_format}"
+        # -ar: sample rate, -ac: channels (2=stereo), -b:a: bitrate
+        self._options = f"-ar {self._sample_rate} -ac 2 -b:a {self._bitrate}k"
+
     def get_type(self) -> AudioSourceType:
         """Get the type of this audio source.
 
@@ -104,29 +236,22 @@ class LocalAudioSource:
             RuntimeError: If FFmpeg fails to connect to the device.
         """
         try:
-            # Build FFmpeg input format based on platform
-            input_format = self._get_input_format()
-            input_device = self._get_input_device()
-
-            # FFmpeg options for local device capture
-            before_options = f"-f {input_format}"
-
-            # Output options for Discord
-            # -ar: sample rate, -ac: channels (2=stereo), -b:a: bitrate
-            options = f"-ar {self._sample_rate} -ac 2 -b:a {self._bitrate}k"
-
-            logger.info(f"Creating audio source from device: {self._device.name}")
-            logger.debug(f"FFmpeg input: {input_format} {input_device}")
-            logger.debug(f"FFmpeg options: before={before_options}, after={options}")
+            logger.info("Creating audio source from device: %s", self._device.name)
+            logger.debug("FFmpeg input: %s %s", self._input_format, self._input_device)
+            logger.debug(
+                "FFmpeg options: before=%s, after=%s",
+                self._before_options,
+                self._options,
+            )
 
             return discord.FFmpegPCMAudio(
-                input_device,
-                before_options=before_options,
-                options=options,
+                self._input_device,
+                before_options=self._before_options,
+                options=self._options,
             )
 
         except Exception as e:
-            logger.error(f"Failed to create local audio source: {e}")
+            logger.error("Failed to create local audio source: %s", e)
             raise RuntimeError(
                 f"Failed to connect to audio device '{self._device.name}': {e}"
             )
@@ -136,18 +261,15 @@ class LocalAudioSource:
 
         Returns:
             FFmpeg input format string.
-        """
-        import platform
 
-        system = platform.system().lower()
+        Raises:
+            RuntimeError: If the platform is unsupported.
+        """
+        system = _system_type()
 
-        if system == "windows":
-            return "dshow"
-        elif system == "linux":
-            return "pulse"  # or 'alsa' as fallback
-        elif system == "darwin":
-            return "avfoundation"
-        else:
+        try:
+            return _FFMPEG_INPUT_FORMATS[system]
+        except KeyError:
             raise RuntimeError(f"Unsupported platform: {system}")
 
     def _get_input_device(self) -> str:
@@ -159,9 +281,7 @@ class LocalAudioSource:
         # Special handling for desktop audio (system output capture)
         if self._device.device_id == "desktop-audio":
             # Use audio loopback - captures default playback device
-            import platform
-
-            if platform.system().lower() == "windows":
+            if _system_type() == "windows":
                 # For Windows, we'll use dshow with a loopback device or
                 # try to use the default audio renderer
                 return "audio=@device_cm_{33D9A762-90C8-11D0-BD43-00A0C911CE86}\\wave_{00000000-0000-0000-0000-000000000000}"
@@ -170,7 +290,7 @@ class LocalAudioSource:
 
     def cleanup(self) -> None:
         """Clean up any resources used by this audio source."""
-        logger.debug(f"Cleaning up local audio source: {self._device.name}")
+        logger.debug("Cleaning up local audio source: %s", self._device.name)
         # No specific cleanup needed for FFmpeg-based sources
         pass
 
@@ -178,6 +298,8 @@ class LocalAudioSource:
 class URLAudioSource:
     """Audio source that streams from any URL (YouTube, SoundCloud, etc.)."""
 
+    __slots__ = ("_url", "_bitrate", "_before_options", "_options")
+
     def __init__(self, url: str, bitrate: int = 128) -> None:
         """Initialize URL audio source.
 
@@ -188,6 +310,13 @@ class URLAudioSource:
         self._url = url
         self._bitrate = bitrate
 
+        # FFmpeg arguments are constant per source; build them once so each
+        # play reuses the same strings
+        self._before_options = (
+            "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5"
+        )
+        self._options = f"-vn -b:a {self._bitrate}k"
+
     def get_type(self) -> AudioSourceType:
         """Get the type of this audio source.
 
@@ -214,31 +343,49 @@ class URLAudioSource:
             RuntimeError: If FFmpeg fails to connect to the URL.
         """
         try:
-            # FFmpeg options for streaming
-            before_options = "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5"
-            options = f"-vn -b:a {self._bitrate}k"
-
-            logger.info(f"Creating audio source from URL: {self._url}")
+            logger.info("Creating audio source from URL: %s", self._url)
 
             return discord.FFmpegPCMAudio(
                 self._url,
-                before_options=before_options,
-                options=options,
+                before_options=self._before_options,
+                options=self._options,
             )
 
         except Exception as e:
-            logger.error(f"Failed to create URL audio source: {e}")
+            logger.error("Failed to create URL audio source: %s", e)
             raise RuntimeError(f"Failed to connect to URL '{self._url}': {e}")
 
     def cleanup(self) -> None:
         """Clean up any resources used by this audio source."""
-        logger.debug(f"Cleaning up URL audio source: {self._url}")
+        logger.debug("Cleaning up URL audio source: %s", self._url)
         pass
 
 
 class WASAPILoopbackPCMAudio(discord.AudioSource):
     """Custom Discord AudioSource that reads from WASAPI loopback."""
 
+    # One Discord frame (20ms at 48kHz stereo 16-bit) of silence, shared by
+    # all fail paths: returning b"" would signal end-of-stream and make
+    # discord.py tear down the player on a transient hiccup.
+    _SILENCE_FRAME = bytes(3840)
+
+    # discord.AudioSource is slotted, so slots here keep instances
+    # dict-free; read() does several attribute loads per 20ms frame.
+    __slots__ = (
+        "_device_index",
+        "_device_name",
+        "_sample_rate",
+        "_channels",
+        "_pyaudio",
+        "_stream",
+        "_needs_resample",
+        "_is_mono",
+        "_fast_path",
+        "_ratecv_state",
+        "_pa_continue",
+        "_frames",
+    )
+
     def __init__(
         self, device_index: int, device_name: str, sample_rate: int, channels: int
     ):
@@ -250,28 +397,62 @@ class WASAPILoopbackPCMAudio(discord.AudioSource):
             sample_rate: Device sample rate.
             channels: Number of audio channels.
         """
-        import pyaudiowpatch as pyaudio
-        import audioop
+        pyaudio = _lazy_pyaudio()
 
         self._device_index = device_index
         self._device_name = device_name
         self._sample_rate = sample_rate
         self._channels = channels
-        self._pyaudio = pyaudio.PyAudio()
+        self._pyaudio = _get_pyaudio_instance()
         self._stream = None
-        self._buffer = b""
-
-        # Open audio stream
+        # Resolve per-frame decisions once; carry ratecv filter state
+        # across frames so each 20ms chunk continues the previous one.
+        self._needs_resample = sample_rate != 48000
+        self._is_mono = channels == 1
+        # Stereo 48kHz devices (the common WASAPI case) need no conversion
+        # at all, so read() can hand chunks straight to Discord.
+        self._fast_path = not self._needs_resample and not self._is_mono
+        self._ratecv_state: Optional[Any] = None
+        self._pa_continue: int = pyaudio.paContinue
+
+        # Ring buffer of captured 20ms chunks filled from PyAudio's callback
+        # thread; bounded so a stalled consumer drops oldest audio instead of
+        # growing without limit (~640ms of headroom).
+        self._frames: Deque[bytes] = deque(maxlen=32)
+
+        # Open audio stream in callback mode so capture never blocks read()
         self._stream = self._pyaudio.open(
             format=pyaudio.paInt16,
             channels=self._channels,
             rate=self._sample_rate,
-            frames_per_buffer=960,  # 20ms at 48kHz
+            frames_per_buffer=int(self._sample_rate * 0.02),  # 20ms chunks
             input=True,
             input_device_index=self._device_index,
+            stream_callback=self._on_audio,
         )
 
-        logger.info(f"WASAPI loopback stream opened: {self._device_name}")
+        logger.info("WASAPI loopback stream opened: %s", self._device_name)
+
+    def _on_audio(
+        self,
+        in_data: bytes,
+        frame_count: int,
+        time_info: Dict[str, Any],
+        status: int,
+    ) -> Tuple[Optional[bytes], int]:
+        """PyAudio capture callback; runs on PortAudio's worker thread.
+
+        Args:
+            in_data: Captured PCM chunk.
+            frame_count: Number of frames captured.
+            time_info: PortAudio timing info.
+            status: PortAudio status flags.
+
+        Returns:
+            (None, paContinue) to keep the stream running.
+        """
+        self._frames.append(in_data)
+        return (None, self._pa_continue)
 
     def read(self) -> bytes:
         """Read 20ms of audio data.
@@ -283,52 +464,71 @@ class WASAPILoopbackPCMAudio(discord.AudioSource):
         """
         try:
             if not self._stream or not self._stream.is_active():
-                return b""
+                return self._SILENCE_FRAME
 
-            # Read from PyAudio stream
-            # Need to read enough for 20ms at the device's sample rate
-            frames_needed = int(self._sample_rate * 0.02)  # 20ms worth of frames
-            data = self._stream.read(frames_needed, exception_on_overflow=False)
+            # Pull the next 20ms chunk captured by the callback thread
+            try:
+                data = self._frames.popleft()
+            except IndexError:
+                # Capture is momentarily behind; emit silence to keep the
+                # player alive
+                return self._SILENCE_FRAME
 
-            # Resample if needed
-            if self._sample_rate != 48000:
-                import audioop
+            # Common case: device already delivers 48kHz stereo — no
+            # resampling or channel conversion needed
+            if self._fast_path:
+                return data
 
-                data, _ = audioop.ratecv(
+            # Resample if needed
+            if self._needs_resample:
+                data, self._ratecv_state = audioop.ratecv(
                     data,
                     2,  # 16-bit = 2 bytes
                     self._channels,
                     self._sample_rate,
                     48000,
-                    None,
+                    self._ratecv_state,
                 )
 
             # Convert to stereo if mono
-            if self._channels == 1:
-                import audioop
-
-                data = audioop.tostereo(data, 2, 1, 1)
+            if self._is_mono:
+                if np is not None:
+                    # Plain sample duplication vectorizes to a SIMD copy,
+                    # skipping audioop's per-sample weighting
+                    data = np.frombuffer(data, dtype=np.int16).repeat(2).tobytes()
+                else:
+                    data = audioop.tostereo(data, 2, 1, 1)
 
             return data
 
         except Exception as e:
-            logger.error(f"Error reading from WASAPI loopback: {e}")
-            return b""
+            logger.error("Error reading from WASAPI loopback: %s", e)
+            return self._SILENCE_FRAME
 
     def cleanup(self) -> None:
-        """Clean up audio stream resources."""
+        """Clean up audio stream resources.
+
+        The shared PyAudio instance is left running; it is terminated once
+        at interpreter exit.
+        """
         if self._stream:
             self._stream.stop_stream()
             self._stream.close()
             logger.info("WASAPI loopback stream closed")
 
-        if self._pyaudio:
-            self._pyaudio.terminate()
-
 
 class WASAPILoopbackAudioSource:
     """Audio source that captures system audio using WASAPI loopback."""
 
+    __slots__ = (
+        "_device_index",
+        "_sample_rate",
+        "_bitrate",
+        "_device_name",
+        "_device_sample_rate",
+        "_device_channels",
+    )
+
     def __init__(
         self, device_index: int, sample_rate: int = 48000, bitrate: int = 128
     ) -> None:
@@ -344,18 +544,14 @@ class WASAPILoopbackAudioSource:
         self._bitrate = bitrate
         self._device_name = "Unknown Device"
 
-        # Get device info
+        # Get device info (cached across sources for the same index)
         try:
-            import pyaudiowpatch as pyaudio
-
-            p = pyaudio.PyAudio()
-            info = p.get_device_info_by_index(device_index)
+            info = _get_device_info(device_index)
             self._device_name = info["name"].replace(" [Loopback]", "")
             self._device_sample_rate = int(info["defaultSampleRate"])
             self._device_channels = info["maxInputChannels"]
-            p.terminate()
         except Exception as e:
-            logger.warning(f"Could not get device info: {e}")
+            logger.warning("Could not get device info: %s", e)
             self._device_sample_rate = 48000
             self._device_channels = 2
 
@@ -385,9 +581,12 @@ class WASAPILoopbackAudioSource:
             RuntimeError: If audio capture fails.
         """
         try:
-            logger.info(f"Creating WASAPI loopback source: {self._device_name}")
+            logger.info("Creating WASAPI loopback source: %s", self._device_name)
             logger.debug(
-                f"Device index: {self._device_index}, Sample rate: {self._device_sample_rate}, Channels: {self._device_channels}"
+                "Device index: %s, Sample rate: %s, Channels: %s",
+                self._device_index,
+                self._device_sample_rate,
+                self._device_channels,
             )
 
             # Create custom PCM audio source
@@ -403,9 +602,9 @@ class WASAPILoopbackAudioSource:
                 "pyaudiowpatch not installed - cannot use WASAPI loopback"
             )
         except Exception as e:
-            logger.error(f"Failed to create WASAPI loopback source: {e}")
+            logger.error("Failed to create WASAPI loopback source: %s", e)
             raise RuntimeError(f"Failed to capture system audio: {e}")
 
     def cleanup(self) -> None:
         """Clean up any resources used by this audio source."""
-        logger.debug(f"Cleaning up WASAPI loopback source: {self._device_name}")
+        logger.debug("Cleaning up WASAPI loopback source: %s", self._device_name)
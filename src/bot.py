@@ -1,7 +1,8 @@
 """Discord bot implementation for DJ streaming."""
 
+import asyncio
 import logging
-from typing import Optional, Union, cast
+from typing import Optional, cast
 import discord
 from discord.ext import commands
 from src.config import BotConfig
@@ -21,7 +22,12 @@ class DJBot(commands.Bot):
             config: Bot configuration.
             audio_source: Audio source to stream from.
         """
-        intents = discord.Intents.default()
+        # Start from no intents and enable only what the bot uses: the
+        # default set subscribes to presence/typing/reaction dispatches
+        # that cost gateway decode + callback time on every event.
+        intents = discord.Intents.none()
+        intents.guilds = True
+        intents.guild_messages = True
         intents.message_content = True
         intents.voice_states = True
 
@@ -30,11 +36,51 @@ class DJBot(commands.Bot):
         self._config = config
         self._audio_source = audio_source
         self._voice_client: Optional[discord.VoiceClient] = None
+        self._commands_registered = False
+        # Playback state, maintained on play/stop/playback-end transitions
+        # so state queries are a single attribute read
+        self._playing = False
 
-        # Register commands
-        self.add_command(self._create_join_command())
-        self.add_command(self._create_play_command())
-        self.add_command(self._create_stop_command())
+    async def setup_hook(self) -> None:
+        """Register commands lazily, once the bot is actually starting.
+
+        discord.py calls this after login but before connecting to the
+        gateway, so constructing a DJBot stays cheap.
+        """
+        self._register_commands()
+
+    def _register_commands(self) -> None:
+        """Register the bot commands (idempotent).
+
+        The command logic lives in the ``_join``/``_play``/``_stop``
+        methods; the closures here are one-line shims because discord.py
+        requires plain ``(ctx)`` callables (methods defined in a class are
+        assumed to be cog-style and expect an extra parameter).
+        """
+        if self._commands_registered:
+            return
+        self._commands_registered = True
+
+        @commands.command(name="join")
+        @commands.guild_only()
+        async def join(ctx: commands.Context) -> None:
+            """Join the voice channel of the user who invoked the command."""
+            await self._join(ctx)
+
+        @commands.command(name="play")
+        @commands.guild_only()
+        async def play(ctx: commands.Context) -> None:
+            """Start streaming audio from the configured audio source."""
+            await self._play(ctx)
+
+        @commands.command(name="stop")
+        async def stop(ctx: commands.Context) -> None:
+            """Stop streaming audio and disconnect from voice channel."""
+            await self._stop(ctx)
+
+        self.add_command(join)
+        self.add_command(play)
+        self.add_command(stop)
 
     def get_config(self) -> BotConfig:
         """Get bot configuration.
@@ -58,141 +104,125 @@ class DJBot(commands.Bot):
         Returns:
             True if streaming, False otherwise.
         """
-        return self._voice_client is not None and self._voice_client.is_playing()
+        return self._playing
+
+    def _on_playback_end(self, error: Optional[Exception]) -> None:
+        """Playback-finished callback passed to VoiceClient.play.
+
+        Args:
+            error: Player error, if playback ended abnormally.
+        """
+        self._playing = False
+        if error:
+            logger.error("Player error: %s", error)
 
     async def on_ready(self) -> None:
         """Called when the bot is ready."""
-        logger.info(f"Bot logged in as {self.user}")
-        logger.info(f"Connected to {len(self.guilds)} guilds")
+        logger.info("Bot logged in as %s", self.user)
+        logger.info("Connected to %d guilds", len(self.guilds))
 
-    def _create_join_command(self) -> commands.Command:
-        """Create the join voice channel command.
+    async def _join(self, ctx: commands.Context) -> None:
+        """Join the voice channel of the user who invoked the command."""
+        # The guild_only check guarantees ctx.author is a Member here, so
+        # no runtime isinstance guard is needed on the command path
+        author = cast(discord.Member, ctx.author)
 
-        Returns:
-            Join command.
-        """
+        if not author.voice:
+            await ctx.send("You need to be in a voice channel to use this command.")
+            return
 
-        @commands.command(name="join")
-        async def join(ctx: commands.Context) -> None:
-            """Join the voice channel of the user who invoked the command."""
-            # Type guard: ctx.author must be a Member to have voice attribute
-            if not isinstance(ctx.author, discord.Member):
-                await ctx.send("This command can only be used in a server.")
-                return
+        channel = author.voice.channel
+        if channel is None:
+            await ctx.send("Could not determine your voice channel.")
+            return
 
-            if not ctx.author.voice:
+        if self._voice_client and self._voice_client.is_connected():
+            await ctx.send("Already connected to a voice channel.")
+            return
+
+        try:
+            # channel is VoiceChannel or StageChannel, both have connect()
+            self._voice_client = await channel.connect()
+            await ctx.send(f"Joined {channel.name}")
+            logger.info("Joined voice channel: %s", channel.name)
+        except Exception as e:
+            logger.error("Failed to join voice channel: %s", e)
+            await ctx.send(f"Failed to join voice channel: {e}")
+
+    async def _play(self, ctx: commands.Context) -> None:
+        """Start streaming audio from the configured audio source."""
+        # Auto-join if not connected
+        if not self._voice_client or not self._voice_client.is_connected():
+            # guild_only guarantees ctx.author is a Member
+            author = cast(discord.Member, ctx.author)
+
+            if not author.voice:
                 await ctx.send("You need to be in a voice channel to use this command.")
                 return
 
-            channel = ctx.author.voice.channel
+            channel = author.voice.channel
             if channel is None:
                 await ctx.send("Could not determine your voice channel.")
                 return
 
-            if self._voice_client and self._voice_client.is_connected():
-                await ctx.send("Already connected to a voice channel.")
-                return
-
+            # Acknowledge immediately so the user sees a response while the
+            # (200-500ms) voice connect runs; the send overlaps the connect
+            ack_task = asyncio.create_task(ctx.send(f"Joining {channel.name}..."))
             try:
-                # channel is VoiceChannel or StageChannel, both have connect()
+                # Join the user's voice channel
                 self._voice_client = await channel.connect()
-                await ctx.send(f"Joined {channel.name}")
-                logger.info(f"Joined voice channel: {channel.name}")
             except Exception as e:
-                logger.error(f"Failed to join voice channel: {e}")
-                await ctx.send(f"Failed to join voice channel: {e}")
-
-        return join
-
-    def _create_play_command(self) -> commands.Command:
-        """Create the play stream command.
-
-        Returns:
-            Play command.
-        """
-
-        @commands.command(name="play")
-        async def play(ctx: commands.Context) -> None:
-            """Start streaming audio from the configured audio source."""
-            # Auto-join if not connected
-            if not self._voice_client or not self._voice_client.is_connected():
-                # Type guard: ctx.author must be a Member to have voice attribute
-                if not isinstance(ctx.author, discord.Member):
-                    await ctx.send("This command can only be used in a server.")
-                    return
-
-                if not ctx.author.voice:
-                    await ctx.send(
-                        "You need to be in a voice channel to use this command."
-                    )
-                    return
-
-                channel = ctx.author.voice.channel
-                if channel is None:
-                    await ctx.send("Could not determine your voice channel.")
-                    return
-
-                try:
-                    # Join the user's voice channel
-                    self._voice_client = await channel.connect()
-                    await ctx.send(f"Joined {channel.name}")
-                    logger.info(f"Auto-joined voice channel: {channel.name}")
-                except Exception as e:
-                    logger.error(f"Failed to join voice channel: {e}")
-                    await ctx.send(f"Failed to join voice channel: {e}")
-                    return
-
-            if self._voice_client.is_playing():
-                await ctx.send("Already playing audio.")
-                return
-
-            try:
-                # Create Discord audio source from the configured source
-                discord_audio = self._audio_source.create_discord_source()
-
-                # Start playing
-                self._voice_client.play(
-                    discord_audio,
-                    after=lambda e: logger.error(f"Player error: {e}") if e else None,
-                )
-
-                description = self._audio_source.get_description()
-                await ctx.send(f"Now streaming: {description}")
-                logger.info(f"Started streaming: {description}")
-
-            except Exception as e:
-                logger.error(f"Failed to start streaming: {e}")
-                await ctx.send(f"Failed to start streaming: {e}")
-
-        return play
-
-    def _create_stop_command(self) -> commands.Command:
-        """Create the stop streaming command.
-
-        Returns:
-            Stop command.
-        """
-
-        @commands.command(name="stop")
-        async def stop(ctx: commands.Context) -> None:
-            """Stop streaming audio and disconnect from voice channel."""
-            if not self._voice_client:
-                await ctx.send("Not connected to a voice channel.")
-                return
-
-            if not self._voice_client.is_playing():
-                await ctx.send("Not currently playing audio.")
+                logger.error("Failed to join voice channel: %s", e)
+                ack = await ack_task
+                await ack.edit(content=f"Failed to join voice channel: {e}")
                 return
 
-            # Stop playback and disconnect
-            self._voice_client.stop()
-            await self._voice_client.disconnect()
-            self._voice_client = None
-
-            await ctx.send("Stopped streaming and disconnected from voice channel")
-            logger.info("Stopped streaming and disconnected from voice channel")
-
-        return stop
+            ack = await ack_task
+            await ack.edit(content=f"Joined {channel.name}")
+            logger.info("Auto-joined voice channel: %s", channel.name)
+
+        if self._playing:
+            await ctx.send("Already playing audio.")
+            return
+
+        try:
+            # Create Discord audio source from the configured source.
+            # This spawns FFmpeg / opens a capture stream, so run it in a
+            # worker thread to keep the event loop responsive.
+            discord_audio = await asyncio.to_thread(
+                self._audio_source.create_discord_source
+            )
+
+            # Start playing
+            self._voice_client.play(discord_audio, after=self._on_playback_end)
+            self._playing = True
+
+            description = self._audio_source.get_description()
+            await ctx.send(f"Now streaming: {description}")
+            logger.info("Started streaming: %s", description)
+
+        except Exception as e:
+            logger.error("Failed to start streaming: %s", e)
+            await ctx.send(f"Failed to start streaming: {e}")
+
+    async def _stop(self, ctx: commands.Context) -> None:
+        """Stop streaming audio and disconnect from voice channel."""
+        if not self._voice_client:
+            await ctx.send("Not connected to a voice channel.")
+            return
+
+        if not self._playing:
+            await ctx.send("Not currently playing audio.")
+            return
+
+        # Stop playback and disconnect
+        self._voice_client.stop()
+        self._playing = False
+        await self._voice_client.disconnect()
+        self._voice_client = None
+
+        await ctx.send("Stopped streaming and disconnected from voice channel")
+        logger.info("Stopped streaming and disconnected from voice channel")
 
     async def cleanup(self) -> None:
         """Cleanup bot resources."""
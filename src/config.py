@@ -2,11 +2,11 @@
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Set, Tuple
 from dotenv import load_dotenv
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiscordConfig:
     """Discord bot configuration."""
 
@@ -15,7 +15,7 @@ class DiscordConfig:
     command_prefix: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AudioConfig:
     """Audio streaming configuration."""
 
@@ -23,7 +23,7 @@ class AudioConfig:
     sample_rate: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AudioSourceConfig:
     """Configuration for the selected audio source."""
 
@@ -34,7 +34,8 @@ class AudioSourceConfig:
     sample_rate: int = 48000
 
 
-@dataclass
+# Not frozen: main.py assigns audio_source after interactive selection.
+@dataclass(slots=True)
 class BotConfig:
     """Complete bot configuration."""
 
@@ -44,7 +45,43 @@ class BotConfig:
 
 
 class ConfigLoader:
-    """Loads and validates configuration from environment variables."""
+    """Loads and validates configuration from environment variables.
+
+    Loaded configurations are cached per env file path: configuration is
+    immutable for the process lifetime, so repeated ``load_config`` calls
+    (status commands, reconnect paths) skip the .env re-parse and the
+    environment lookups. Call ``invalidate_cache()`` to force a reload.
+    """
+
+    _config_cache: Dict[Optional[str], BotConfig] = {}
+    _loaded_env_paths: Set[Optional[str]] = set()
+    # Variables that must be non-empty before a config can be built
+    _REQUIRED_ENV_VARS: Tuple[str, ...] = ("DISCORD_BOT_TOKEN",)
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Clear cached configurations, forcing the next load to re-read."""
+        cls._config_cache.clear()
+        cls._loaded_env_paths.clear()
+
+    @classmethod
+    def _ensure_env(cls, env_path: Optional[str] = None) -> None:
+        """Load each .env file once per process.
+
+        ``load_dotenv`` reads and parses the file from disk on every call;
+        the environment does not change underneath a running bot, so
+        repeated loads are pure overhead (and synchronous I/O if called
+        from the event loop). Loaded paths are tracked individually so the
+        guard agrees with the per-path config cache: asking for a new env
+        path always reads that file. Use ``invalidate_cache()`` to force a
+        reload.
+
+        Args:
+            env_path: Optional path to .env file.
+        """
+        if env_path not in cls._loaded_env_paths:
+            cls.load_env(env_path)
+            cls._loaded_env_paths.add(env_path)
 
     @staticmethod
     def load_env(env_path: Optional[str] = None) -> None:
@@ -93,7 +130,20 @@ class ConfigLoader:
         Raises:
             ValueError: If required configuration is missing.
         """
-        cls.load_env(env_path)
+        cached = cls._config_cache.get(env_path)
+        if cached is not None:
+            return cached
+
+        cls._ensure_env(env_path)
+
+        # Check every required variable up front so a misconfigured
+        # deployment reports all missing names in one error, rather than
+        # failing one variable at a time across restarts.
+        missing = [name for name in cls._REQUIRED_ENV_VARS if not os.getenv(name)]
+        if missing:
+            raise ValueError(
+                f"Required environment variables not set: {', '.join(missing)}"
+            )
 
         discord_config = DiscordConfig(
             token=cls.get_env_var("DISCORD_BOT_TOKEN"),
@@ -106,8 +156,10 @@ class ConfigLoader:
             sample_rate=int(cls.get_env_var("AUDIO_SAMPLE_RATE", default="48000")),
         )
 
-        return BotConfig(
+        config = BotConfig(
             discord=discord_config,
             audio=audio_config,
             audio_source=None,  # Will be set by CLI selection
         )
+        cls._config_cache[env_path] = config
+        return config
@@ -1,7 +1,10 @@
 """Test script to verify audio capture is working."""
 
+import re
 import subprocess
-import sys
+
+# Matches FFmpeg dshow device-listing lines, e.g. "Microphone" (audio)
+_DEV_RE = re.compile(r'"([^"]+)"\s*\(audio\)')
 
 print("=" * 60)
 print("Audio Capture Test")
@@ -15,15 +18,11 @@ result = subprocess.run(
     text=True,
 )
 
-# Show only audio devices
+# Show only audio devices: one regex sweep over the full stderr instead
+# of splitting into a line list and substring-checking each line
 print("Available Audio Input Devices:")
-for line in result.stderr.split("\n"):
-    if "(audio)" in line and '"' in line:
-        # Extract device name
-        import re
-        match = re.search(r'"([^"]+)"\s*\(audio\)', line)
-        if match:
-            print(f"  - {match.group(1)}")
+for match in _DEV_RE.finditer(result.stderr):
+    print(f"  - {match.group(1)}")
 
 print("\n" + "=" * 60)
 print("\nTo stream system audio, you need one of these options:\n")
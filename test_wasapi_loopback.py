@@ -11,12 +11,12 @@ p = pyaudio.PyAudio()
 
 print(f"\nFound {p.get_device_count()} audio devices\n")
 
-# List all devices
+# List all devices in one bulk pass: the generator API walks PortAudio's
+# device table directly instead of one indexed C call per device
 print("All Audio Devices:")
 print("-" * 60)
-for i in range(p.get_device_count()):
-    info = p.get_device_info_by_index(i)
-    print(f"\nDevice {i}: {info['name']}")
+for info in p.get_device_info_generator():
+    print(f"\nDevice {info['index']}: {info['name']}")
     print(f"  Max Input Channels: {info['maxInputChannels']}")
     print(f"  Max Output Channels: {info['maxOutputChannels']}")
     print(f"  Default Sample Rate: {info['defaultSampleRate']}")
@@ -1,10 +1,22 @@
 """Tests for audio source factory."""
 
 import pytest
+from dataclasses import replace
 from unittest.mock import Mock, patch
 from src.audio_source_factory import AudioSourceFactory
 from src.audio_sources import LocalAudioSource, URLAudioSource
 from src.audio_device import AudioDevice
+from src.config import AudioSourceConfig
+
+
+# Canonical immutable device shared across tests; AudioDevice is frozen,
+# so reuse is safe and saves a construction per test
+_TEST_DEVICE = AudioDevice(
+    index=1,
+    name="Test Device",
+    device_id="audio=Test Device",
+    device_type="input",
+)
 
 
 class TestAudioSourceFactory:
@@ -12,15 +24,8 @@ class TestAudioSourceFactory:
 
     def test_create_local_source(self) -> None:
         """Test creating a local audio source."""
-        device = AudioDevice(
-            index=1,
-            name="Test Device",
-            device_id="audio=Test Device",
-            device_type="input",
-        )
-
         source = AudioSourceFactory.create_local_source(
-            device=device, sample_rate=48000, bitrate=128
+            device=_TEST_DEVICE, sample_rate=48000, bitrate=128
         )
 
         assert isinstance(source, LocalAudioSource)
@@ -29,13 +34,9 @@ class TestAudioSourceFactory:
     @patch("src.audio_source_factory.AudioDeviceEnumerator.get_device_by_index")
     def test_create_local_source_by_index(self, mock_get_device: Mock) -> None:
         """Test creating a local audio source by index."""
-        mock_device = AudioDevice(
-            index=2,
-            name="Device 2",
-            device_id="audio=Device 2",
-            device_type="input",
+        mock_get_device.return_value = replace(
+            _TEST_DEVICE, index=2, name="Device 2", device_id="audio=Device 2"
         )
-        mock_get_device.return_value = mock_device
 
         source = AudioSourceFactory.create_local_source_by_index(device_index=2)
 
@@ -62,48 +63,46 @@ class TestAudioSourceFactory:
     @patch("src.audio_source_factory.AudioDeviceEnumerator.get_device_by_index")
     def test_create_from_config_local(self, mock_get_device: Mock) -> None:
         """Test creating local source from config."""
-        mock_device = AudioDevice(
-            index=1,
-            name="Test Device",
-            device_id="audio=Test Device",
-            device_type="input",
-        )
-        mock_get_device.return_value = mock_device
+        mock_get_device.return_value = _TEST_DEVICE
 
-        config = {"device_index": 1, "sample_rate": 48000, "bitrate": 128}
-
-        source = AudioSourceFactory.create_from_config(
-            source_type="local", config=config
+        config = AudioSourceConfig(
+            source_type="local", device_index=1, sample_rate=48000, bitrate=128
         )
 
+        source = AudioSourceFactory.create_from_config(config)
+
         assert isinstance(source, LocalAudioSource)
         mock_get_device.assert_called_once_with(1)
 
     def test_create_from_config_local_missing_index(self) -> None:
         """Test error when creating local source without device_index."""
-        config = {"sample_rate": 48000, "bitrate": 128}
+        config = AudioSourceConfig(source_type="local")
 
         with pytest.raises(ValueError, match="requires 'device_index'"):
-            AudioSourceFactory.create_from_config(source_type="local", config=config)
+            AudioSourceFactory.create_from_config(config)
 
     def test_create_from_config_url(self) -> None:
         """Test creating URL source from config."""
-        config = {"url": "http://example.com/audio.mp3", "bitrate": 192}
+        config = AudioSourceConfig(
+            source_type="url", url="http://example.com/audio.mp3", bitrate=192
+        )
 
-        source = AudioSourceFactory.create_from_config(source_type="url", config=config)
+        source = AudioSourceFactory.create_from_config(config)
 
         assert isinstance(source, URLAudioSource)
 
     def test_create_from_config_url_missing_url(self) -> None:
         """Test error when creating URL source without URL."""
-        config = {"bitrate": 192}
+        config = AudioSourceConfig(source_type="url", bitrate=192)
 
         with pytest.raises(ValueError, match="requires 'url'"):
-            AudioSourceFactory.create_from_config(source_type="url", config=config)
+            AudioSourceFactory.create_from_config(config)
 
     def test_create_from_config_invalid_type(self) -> None:
         """Test error when creating source with invalid type."""
-        config = {"url": "http://example.com/audio.mp3"}
+        config = AudioSourceConfig(
+            source_type="invalid", url="http://example.com/audio.mp3"
+        )
 
         with pytest.raises(ValueError, match="Unknown audio source type"):
-            AudioSourceFactory.create_from_config(source_type="invalid", config=config)
+            AudioSourceFactory.create_from_config(config)
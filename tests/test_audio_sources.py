@@ -2,18 +2,52 @@
 
 import pytest
 from unittest.mock import Mock, patch
-import discord
 from src.audio_sources import (
     AudioSourceType,
     LocalAudioSource,
     URLAudioSource,
+    _system_type,
 )
 from src.audio_device import AudioDevice
 
 
+# Canonical immutable devices shared across tests; AudioDevice is frozen,
+# so reuse is safe and saves a construction per test
+_TEST_DEVICE = AudioDevice(
+    index=1, name="Test", device_id="audio=Test", device_type="input"
+)
+_WIN_DEVICE = AudioDevice(
+    index=1, name="Microphone", device_id="audio=Microphone", device_type="input"
+)
+_PULSE_DEVICE = AudioDevice(
+    index=1, name="pulse_device", device_id="pulse_device", device_type="input"
+)
+_MAC_DEVICE = AudioDevice(
+    index=1, name="Built-in Microphone", device_id=":0", device_type="input"
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_ffmpeg(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Patch discord.FFmpegPCMAudio once per test via monkeypatch.
+
+    Replaces the per-test @patch decorators; tests that assert on the
+    FFmpeg invocation accept this fixture as a parameter.
+    """
+    m = Mock()
+    monkeypatch.setattr("discord.FFmpegPCMAudio", m)
+    return m
+
+
+@pytest.mark.discordheavy
 class TestLocalAudioSource:
     """Tests for LocalAudioSource class."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_platform_cache(self) -> None:
+        """Clear the memoized platform lookup so per-test patches apply."""
+        _system_type.cache_clear()
+
     def test_initialization(self) -> None:
         """Test LocalAudioSource initialization."""
         device = AudioDevice(
@@ -22,82 +56,40 @@ class TestLocalAudioSource:
             device_id="audio=Test Microphone",
             device_type="input",
         )
-
         source = LocalAudioSource(device=device, sample_rate=48000, bitrate=128)
 
         assert source.get_type() == AudioSourceType.LOCAL_DEVICE
         assert "Test Microphone" in source.get_description()
 
+    @pytest.mark.parametrize(
+        "platform_name,device,expected_format",
+        [
+            ("Windows", _WIN_DEVICE, "dshow"),
+            ("Linux", _PULSE_DEVICE, "pulse"),
+            ("Darwin", _MAC_DEVICE, "avfoundation"),
+        ],
+    )
     @patch("platform.system")
-    @patch("discord.FFmpegPCMAudio")
-    def test_create_discord_source_windows(
-        self, mock_ffmpeg: Mock, mock_system: Mock
+    def test_create_discord_source_platform(
+        self,
+        mock_system: Mock,
+        platform_name: str,
+        device: AudioDevice,
+        expected_format: str,
+        mock_ffmpeg: Mock,
     ) -> None:
-        """Test creating Discord source on Windows."""
-        mock_system.return_value = "Windows"
-
-        device = AudioDevice(
-            index=1,
-            name="Microphone",
-            device_id="audio=Microphone",
-            device_type="input",
-        )
+        """Test creating Discord source on each supported platform."""
+        mock_system.return_value = platform_name
 
         source = LocalAudioSource(device=device)
-        discord_source = source.create_discord_source()
+        source.create_discord_source()
 
         # Verify FFmpegPCMAudio was called with correct parameters
         mock_ffmpeg.assert_called_once()
-        call_args = mock_ffmpeg.call_args
-
-        assert "audio=Microphone" in str(call_args)
-        assert "dshow" in str(call_args)
-
-    @patch("platform.system")
-    @patch("discord.FFmpegPCMAudio")
-    def test_create_discord_source_linux(
-        self, mock_ffmpeg: Mock, mock_system: Mock
-    ) -> None:
-        """Test creating Discord source on Linux."""
-        mock_system.return_value = "Linux"
-
-        device = AudioDevice(
-            index=1,
-            name="pulse_device",
-            device_id="pulse_device",
-            device_type="input",
-        )
-
-        source = LocalAudioSource(device=device)
-        discord_source = source.create_discord_source()
-
-        mock_ffmpeg.assert_called_once()
-        call_args = mock_ffmpeg.call_args
+        args, kwargs = mock_ffmpeg.call_args
 
-        assert "pulse" in str(call_args)
-
-    @patch("platform.system")
-    @patch("discord.FFmpegPCMAudio")
-    def test_create_discord_source_macos(
-        self, mock_ffmpeg: Mock, mock_system: Mock
-    ) -> None:
-        """Test creating Discord source on macOS."""
-        mock_system.return_value = "Darwin"
-
-        device = AudioDevice(
-            index=1,
-            name="Built-in Microphone",
-            device_id=":0",
-            device_type="input",
-        )
-
-        source = LocalAudioSource(device=device)
-        discord_source = source.create_discord_source()
-
-        mock_ffmpeg.assert_called_once()
-        call_args = mock_ffmpeg.call_args
-
-        assert "avfoundation" in str(call_args)
+        assert args[0] == device.device_id
+        assert kwargs["before_options"] == f"-f {expected_format}"
 
     @patch("platform.system")
     def test_create_discord_source_unsupported_platform(
@@ -106,52 +98,29 @@ class TestLocalAudioSource:
         """Test error on unsupported platform."""
         mock_system.return_value = "FreeBSD"
 
-        device = AudioDevice(
-            index=1,
-            name="Test",
-            device_id="test",
-            device_type="input",
-        )
-
-        source = LocalAudioSource(device=device)
-
         with pytest.raises(RuntimeError, match="Unsupported platform"):
-            source.create_discord_source()
+            LocalAudioSource(device=_TEST_DEVICE)
 
     @patch("platform.system")
-    @patch("discord.FFmpegPCMAudio")
     def test_create_discord_source_ffmpeg_error(
-        self, mock_ffmpeg: Mock, mock_system: Mock
+        self, mock_system: Mock, mock_ffmpeg: Mock
     ) -> None:
         """Test error when FFmpeg fails."""
         mock_system.return_value = "Windows"
         mock_ffmpeg.side_effect = Exception("FFmpeg error")
 
-        device = AudioDevice(
-            index=1,
-            name="Test",
-            device_id="audio=Test",
-            device_type="input",
-        )
-
-        source = LocalAudioSource(device=device)
+        source = LocalAudioSource(device=_TEST_DEVICE)
 
         with pytest.raises(RuntimeError, match="Failed to connect to audio device"):
             source.create_discord_source()
 
     def test_cleanup(self) -> None:
         """Test cleanup method."""
-        device = AudioDevice(
-            index=1,
-            name="Test",
-            device_id="audio=Test",
-            device_type="input",
-        )
-
-        source = LocalAudioSource(device=device)
+        source = LocalAudioSource(device=_TEST_DEVICE)
         source.cleanup()  # Should not raise
 
 
+@pytest.mark.discordheavy
 class TestURLAudioSource:
     """Tests for URLAudioSource class."""
 
@@ -162,18 +131,16 @@ class TestURLAudioSource:
         assert source.get_type() == AudioSourceType.URL_STREAM
         assert "http://example.com/audio.mp3" in source.get_description()
 
-    @patch("discord.FFmpegPCMAudio")
     def test_create_discord_source(self, mock_ffmpeg: Mock) -> None:
         """Test creating Discord source from URL."""
         source = URLAudioSource(url="http://example.com/audio.mp3")
-        discord_source = source.create_discord_source()
+        source.create_discord_source()
 
         mock_ffmpeg.assert_called_once()
-        call_args = mock_ffmpeg.call_args
+        args, _ = mock_ffmpeg.call_args
 
-        assert "http://example.com/audio.mp3" in str(call_args)
+        assert args[0] == "http://example.com/audio.mp3"
 
-    @patch("discord.FFmpegPCMAudio")
     def test_create_discord_source_error(self, mock_ffmpeg: Mock) -> None:
         """Test error when creating Discord source fails."""
         mock_ffmpeg.side_effect = Exception("Network error")
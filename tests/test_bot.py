@@ -9,12 +9,28 @@ from src.config import BotConfig, DiscordConfig, AudioConfig
 from src.audio_sources import AudioSourceType
 
 
+class _StubVoiceClient:
+    """Lightweight stand-in for discord.VoiceClient.
+
+    Mock(spec=discord.VoiceClient) introspects the full class on every
+    construction; the tests only call these five methods.
+    """
+
+    def __init__(self, connected: bool = False) -> None:
+        self.is_connected = Mock(return_value=connected)
+        self.is_playing = Mock(return_value=False)
+        self.play = Mock()
+        self.stop = Mock()
+        self.disconnect = AsyncMock()
+
+
+@pytest.mark.discordheavy
 class TestDJBot:
     """Tests for DJBot class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self) -> BotConfig:
-        """Create mock configuration for testing."""
+        """Create mock configuration shared across tests (never mutated)."""
         return BotConfig(
             discord=DiscordConfig(
                 token="test_token", guild_id="123456", command_prefix="!"
@@ -25,12 +41,15 @@ class TestDJBot:
     @pytest.fixture
     def mock_audio_source(self) -> Mock:
         """Create mock audio source for testing."""
-        mock_source = Mock()
-        mock_source.get_type.return_value = AudioSourceType.LOCAL_DEVICE
-        mock_source.get_description.return_value = "Test Audio Source"
-        mock_source.create_discord_source.return_value = Mock(spec=discord.AudioSource)
-        mock_source.cleanup = Mock()
-        return mock_source
+        # Configure in one constructor call; cleanup is an auto-created
+        # child mock, so it needs no explicit assignment
+        return Mock(
+            **{
+                "get_type.return_value": AudioSourceType.LOCAL_DEVICE,
+                "get_description.return_value": "Test Audio Source",
+                "create_discord_source.return_value": Mock(spec=discord.AudioSource),
+            }
+        )
 
     def test_init(self, mock_config: BotConfig, mock_audio_source: Mock) -> None:
         """Test bot initialization."""
@@ -66,9 +85,7 @@ class TestDJBot:
         """Test is_streaming when connected but not playing."""
         bot = DJBot(mock_config, audio_source=mock_audio_source)
 
-        mock_voice_client = Mock(spec=discord.VoiceClient)
-        mock_voice_client.is_playing = Mock(return_value=False)
-        bot._voice_client = mock_voice_client
+        bot._voice_client = _StubVoiceClient()
 
         assert not bot.is_streaming()
 
@@ -78,9 +95,8 @@ class TestDJBot:
         """Test is_streaming returns True when streaming."""
         bot = DJBot(mock_config, audio_source=mock_audio_source)
 
-        mock_voice_client = Mock(spec=discord.VoiceClient)
-        mock_voice_client.is_playing = Mock(return_value=True)
-        bot._voice_client = mock_voice_client
+        bot._voice_client = _StubVoiceClient()
+        bot._playing = True
 
         assert bot.is_streaming()
 
@@ -114,9 +130,7 @@ class TestDJBot:
         """Test cleanup with active voice client."""
         bot = DJBot(mock_config, audio_source=mock_audio_source)
 
-        mock_voice_client = AsyncMock(spec=discord.VoiceClient)
-        mock_voice_client.is_connected = Mock(return_value=True)
-        mock_voice_client.disconnect = AsyncMock()
+        mock_voice_client = _StubVoiceClient(connected=True)
         bot._voice_client = mock_voice_client
 
         with patch.object(bot, "close", new_callable=AsyncMock) as mock_close:
@@ -142,6 +156,7 @@ class TestDJBot:
     ) -> None:
         """Test that all commands are registered."""
         bot = DJBot(mock_config, audio_source=mock_audio_source)
+        bot._register_commands()
 
         command_names = [cmd.name for cmd in bot.commands]
 
@@ -163,6 +178,7 @@ class TestDJBot:
         mock_ctx.send = AsyncMock()
 
         # Get the join command
+        bot._register_commands()
         join_cmd = bot.get_command("join")
         await join_cmd.callback(mock_ctx)
 
@@ -176,9 +192,7 @@ class TestDJBot:
         """Test join command when already connected."""
         bot = DJBot(mock_config, audio_source=mock_audio_source)
 
-        mock_voice_client = Mock(spec=discord.VoiceClient)
-        mock_voice_client.is_connected = Mock(return_value=True)
-        bot._voice_client = mock_voice_client
+        bot._voice_client = _StubVoiceClient(connected=True)
 
         mock_ctx = AsyncMock(spec=commands.Context)
         mock_ctx.author = Mock(spec=discord.Member)
@@ -186,6 +200,7 @@ class TestDJBot:
         mock_ctx.author.voice.channel = Mock()
         mock_ctx.send = AsyncMock()
 
+        bot._register_commands()
         join_cmd = bot.get_command("join")
         await join_cmd.callback(mock_ctx)
 
@@ -204,6 +219,7 @@ class TestDJBot:
         mock_ctx.author.voice = None
         mock_ctx.send = AsyncMock()
 
+        bot._register_commands()
         play_cmd = bot.get_command("play")
         await play_cmd.callback(mock_ctx)
 
@@ -220,6 +236,7 @@ class TestDJBot:
         mock_ctx = AsyncMock(spec=commands.Context)
         mock_ctx.send = AsyncMock()
 
+        bot._register_commands()
         stop_cmd = bot.get_command("stop")
         await stop_cmd.callback(mock_ctx)
 
@@ -233,13 +250,12 @@ class TestDJBot:
         """Test stop command when not playing audio."""
         bot = DJBot(mock_config, audio_source=mock_audio_source)
 
-        mock_voice_client = Mock(spec=discord.VoiceClient)
-        mock_voice_client.is_playing = Mock(return_value=False)
-        bot._voice_client = mock_voice_client
+        bot._voice_client = _StubVoiceClient()
 
         mock_ctx = AsyncMock(spec=commands.Context)
         mock_ctx.send = AsyncMock()
 
+        bot._register_commands()
         stop_cmd = bot.get_command("stop")
         await stop_cmd.callback(mock_ctx)
 
@@ -2,7 +2,7 @@
 
 import os
 import pytest
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
 from src.config import (
     ConfigLoader,
     BotConfig,
@@ -14,6 +14,11 @@ from src.config import (
 class TestConfigLoader:
     """Tests for ConfigLoader class."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_config_cache(self) -> None:
+        """Clear the config cache so each test loads from its own env."""
+        ConfigLoader.invalidate_cache()
+
     def test_load_env_with_path(self) -> None:
         """Test loading environment variables from specific path."""
         with patch("src.config.load_dotenv") as mock_load:
@@ -101,9 +106,49 @@ class TestConfigLoader:
         """Test loading configuration with missing required variables."""
         with patch.dict(os.environ, {}, clear=True):
             with patch("src.config.load_dotenv"):
-                with pytest.raises(ValueError, match="DISCORD_BOT_TOKEN"):
+                with pytest.raises(
+                    ValueError,
+                    match="Required environment variables not set: DISCORD_BOT_TOKEN",
+                ):
                     ConfigLoader.load_config()
 
+    def test_load_config_cached(self) -> None:
+        """Test that repeated loads return the cached configuration."""
+        env_vars = {"DISCORD_BOT_TOKEN": "test_token"}
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            with patch("src.config.load_dotenv") as mock_load:
+                first = ConfigLoader.load_config()
+                second = ConfigLoader.load_config()
+
+                assert first is second
+                mock_load.assert_called_once()
+
+    def test_invalidate_cache_forces_reload(self) -> None:
+        """Test that invalidate_cache forces a fresh load."""
+        env_vars = {"DISCORD_BOT_TOKEN": "test_token"}
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            with patch("src.config.load_dotenv"):
+                first = ConfigLoader.load_config()
+                ConfigLoader.invalidate_cache()
+                second = ConfigLoader.load_config()
+
+                assert first is not second
+
+    def test_load_config_distinct_env_paths(self) -> None:
+        """Test that each distinct env path is read from disk."""
+        env_vars = {"DISCORD_BOT_TOKEN": "test_token"}
+
+        with patch.dict(os.environ, env_vars, clear=True):
+            with patch("src.config.load_dotenv") as mock_load:
+                ConfigLoader.load_config("a.env")
+                ConfigLoader.load_config("b.env")
+
+                assert mock_load.call_count == 2
+                mock_load.assert_any_call("a.env")
+                mock_load.assert_any_call("b.env")
+
 
 class TestDiscordConfig:
     """Tests for DiscordConfig dataclass."""